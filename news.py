@@ -19,36 +19,69 @@ from tkinter import ttk, messagebox, filedialog
 import requests
 import json
 import sqlite3
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import webbrowser
 from typing import List, Dict, Optional
 import os
 from dotenv import load_dotenv
 import re
+import importlib.util
 from collections import Counter
 
 # Load environment variables
 load_dotenv()
 
-# Try to import optional dependencies
-try:
-    from textblob import TextBlob
-    HAS_TEXTBLOB = True
-except ImportError:
-    HAS_TEXTBLOB = False
+# Check optional dependencies without importing them; heavy modules load on first use
+HAS_TEXTBLOB = importlib.util.find_spec('textblob') is not None
+HAS_MATPLOTLIB = all(importlib.util.find_spec(name) is not None
+                     for name in ('matplotlib', 'seaborn'))
 
 try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import seaborn as sns
-    HAS_MATPLOTLIB = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    HAS_MATPLOTLIB = False
+    _json_loads = json.loads
+
+# TextBlob's pattern-based sentiment scorer, imported on first use
+_pattern_sentiment = None
+
+pd = None
+
+def _pandas():
+    """Import pandas on first use"""
+    global pd
+    if pd is None:
+        import pandas as pd
+    return pd
+
+np = None
+
+def _numpy():
+    """Import numpy on first use"""
+    global np
+    if np is None:
+        import numpy as np
+    return np
+
+# Keyword extraction constants
+_NONALPHA_RE = re.compile(r'[^a-zA-Z\s]')
+_STOPWORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
+    'those', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'must', 'can', 'said', 'says', 'news', 'report'
+})
 
 class NewsArticle:
     """Data class for news articles"""
+    __slots__ = ('title', 'description', 'url', 'source', 'published_at', 'image_url',
+                 'content', 'sentiment_score', 'sentiment_label', 'keywords')
+    
     def __init__(self, title, description, url, source, published_at, 
                  image_url=None, content=None):
         self.title = title
@@ -67,43 +100,108 @@ class NewsAnalyzer:
     
     def __init__(self, db_path: str = "news_analysis.db"):
         self.db_path = db_path
+        
+        # One long-lived connection shared by the GUI worker threads. Autocommit
+        # mode lets save_articles own its BEGIN; the larger statement cache keeps
+        # every query the app issues prepared for the connection's lifetime.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False,
+                                     isolation_level=None, cached_statements=256)
+        self._lock = threading.Lock()
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+                       "cache_size=-20000", "mmap_size=268435456"):
+            self._conn.execute(f"PRAGMA {pragma}")
+        
+        # Pooled HTTP session so repeated fetches reuse the TLS connection
+        self._session = requests.Session()
+        self._session.headers['Accept-Encoding'] = 'gzip, deflate'
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount('https://', adapter)
+        
         self.setup_database()
         
     def setup_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                content TEXT,
-                url TEXT UNIQUE,
-                source TEXT,
-                published_at TIMESTAMP,
-                image_url TEXT,
-                sentiment_score REAL DEFAULT 0.0,
-                sentiment_label TEXT DEFAULT 'neutral',
-                keywords TEXT,
-                category TEXT,
-                bookmarked INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS searches (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                query TEXT,
-                category TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    description TEXT,
+                    content TEXT,
+                    url TEXT UNIQUE,
+                    source TEXT,
+                    published_at TIMESTAMP,
+                    image_url TEXT,
+                    sentiment_score REAL DEFAULT 0.0,
+                    sentiment_label TEXT DEFAULT 'neutral',
+                    keywords TEXT,
+                    category TEXT,
+                    bookmarked INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS searches (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    query TEXT,
+                    category TEXT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    request_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS article_keywords (
+                    article_id INTEGER NOT NULL,
+                    keyword TEXT NOT NULL,
+                    PRIMARY KEY (article_id, keyword)
+                ) WITHOUT ROWID
+            """)
+            
+            # Backfill from the comma-separated column for databases that predate the table
+            cursor.execute("SELECT 1 FROM article_keywords LIMIT 1")
+            if cursor.fetchone() is None:
+                cursor.execute("SELECT id, keywords FROM articles WHERE keywords != ''")
+                rows = [(article_id, keyword) for article_id, keywords in cursor.fetchall()
+                        for keyword in keywords.split(',') if keyword]
+                with self._conn:
+                    self._conn.execute("BEGIN")
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO article_keywords (article_id, keyword) VALUES (?, ?)",
+                        rows
+                    )
+            
+            cursor.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_kw
+                    ON article_keywords(keyword);
+                CREATE INDEX IF NOT EXISTS idx_articles_bookmarked
+                    ON articles(bookmarked, published_at);
+                CREATE INDEX IF NOT EXISTS idx_articles_category_pub
+                    ON articles(category, published_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_searches_ts
+                    ON searches(timestamp DESC);
+            """)
+            
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection and HTTP session"""
+        self._session.close()
+        with self._lock:
+            # Refresh planner statistics for the indexes gathered this session
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
     
     def fetch_news(self, api_key: str, query: str = None, category: str = None, 
                   country: str = "us", page_size: int = 50) -> List[NewsArticle]:
@@ -114,7 +212,6 @@ class NewsAnalyzer:
             # Use everything endpoint for search
             url = "https://newsapi.org/v2/everything"
             params = {
-                'apiKey': api_key,
                 'q': query,
                 'language': 'en',
                 'sortBy': 'publishedAt',
@@ -125,7 +222,6 @@ class NewsAnalyzer:
             # Use top-headlines for category-based news
             url = "https://newsapi.org/v2/top-headlines"
             params = {
-                'apiKey': api_key,
                 'country': country,
                 'pageSize': page_size,
                 'language': 'en'
@@ -134,13 +230,34 @@ class NewsAnalyzer:
                 params['category'] = category
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            # Revalidate the last top-headlines response instead of re-downloading it.
+            # Searches are not cached: their 'from' date changes the URL every day,
+            # so the set of keys would grow without bound.
+            request_url = requests.Request('GET', url, params=params).prepare().url
+            headers = {'X-Api-Key': api_key}
+            cached = None if query else self._get_cached_response(request_url)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            response = self._session.get(url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            
+            if response.status_code == 304 and cached:
+                content = cached[2]
+            else:
+                content = response.content
+            data = _json_loads(content)
             
             if data.get('status') != 'ok':
                 raise Exception(f"API Error: {data.get('message', 'Unknown error')}")
             
+            if response.status_code == 200 and not query:
+                self._store_cached_response(request_url, response)
+            
             for item in data.get('articles', []):
                 if item.get('title') and item.get('title') != '[Removed]':
                     article = NewsArticle(
@@ -161,25 +278,74 @@ class NewsAnalyzer:
         except Exception as e:
             raise Exception(f"Error fetching news: {str(e)}")
     
+    def _get_cached_response(self, request_url: str) -> Optional[tuple]:
+        """Return (etag, last_modified, body) stored for a request URL"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT etag, last_modified, body FROM http_cache WHERE request_url = ?",
+                (request_url,)
+            ).fetchone()
+    
+    def _store_cached_response(self, request_url: str, response):
+        """Remember a response body if the server sent validators for it"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        with self._lock:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO http_cache (request_url, etag, last_modified, body)
+                VALUES (?, ?, ?, ?)
+            """, (request_url, etag, last_modified, response.content))
+    
     def analyze_sentiment(self, text: str) -> tuple:
         """Analyze sentiment using TextBlob"""
-        if not HAS_TEXTBLOB or not text:
-            return 0.0, "neutral"
+        polarity = self._polarities([text])[0]
         
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            
-            if polarity > 0.1:
-                label = "positive"
-            elif polarity < -0.1:
-                label = "negative"
-            else:
-                label = "neutral"
-            
-            return polarity, label
-        except:
-            return 0.0, "neutral"
+        if polarity > 0.1:
+            label = "positive"
+        elif polarity < -0.1:
+            label = "negative"
+        else:
+            label = "neutral"
+        
+        return polarity, label
+    
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[tuple]:
+        """Analyze sentiment for many texts with TextBlob's pattern scorer"""
+        np = _numpy()
+        
+        # Map every polarity to its label in one vectorized pass
+        polarities = np.array(self._polarities(texts), dtype=float)
+        labels = np.select([polarities > 0.1, polarities < -0.1], ["positive", "negative"],
+                           default="neutral")
+        
+        return list(zip(polarities.tolist(), labels.tolist()))
+    
+    def _polarities(self, texts: List[str]) -> List[float]:
+        """Score texts with TextBlob's pattern scorer; 0.0 when unavailable"""
+        global _pattern_sentiment, HAS_TEXTBLOB
+        if not HAS_TEXTBLOB:
+            return [0.0] * len(texts)
+        
+        # Call the lexicon scorer directly instead of building a TextBlob per text
+        if _pattern_sentiment is None:
+            try:
+                from textblob.en import sentiment as _pattern_sentiment
+            except ImportError:
+                # Installed but broken; fall back to neutral like a missing TextBlob
+                HAS_TEXTBLOB = False
+                return [0.0] * len(texts)
+        
+        polarities = []
+        for text in texts:
+            try:
+                polarities.append(_pattern_sentiment(text)[0] if text else 0.0)
+            except:
+                polarities.append(0.0)
+        
+        return polarities
     
     def extract_keywords(self, text: str, num_keywords: int = 5) -> List[str]:
         """Extract keywords from text"""
@@ -187,19 +353,9 @@ class NewsAnalyzer:
             return []
         
         # Clean text
-        text = re.sub(r'[^a-zA-Z\s]', '', text.lower())
-        
-        # Stop words
-        stop_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
-            'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
-            'those', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'must', 'can', 'said', 'says', 'news', 'report'
-        }
+        text = _NONALPHA_RE.sub('', text.lower())
         
-        words = [word for word in text.split() if len(word) >= 3 and word not in stop_words]
+        words = [word for word in text.split() if len(word) >= 3 and word not in _STOPWORDS]
         word_freq = Counter(words)
         return [word for word, _ in word_freq.most_common(num_keywords)]
     
@@ -210,38 +366,120 @@ class NewsAnalyzer:
         article.keywords = self.extract_keywords(full_text)
         return article
     
-    def save_articles(self, articles: List[NewsArticle], category: str = None):
-        """Save articles to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def process_articles_batch(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """Process many articles with one batched sentiment pass"""
+        texts = [f"{article.title} {article.description}" for article in articles]
+        sentiments = self.analyze_sentiment_batch(texts)
         
-        saved_count = 0
-        for article in articles:
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO articles 
-                    (title, description, content, url, source, published_at, image_url,
-                     sentiment_score, sentiment_label, keywords, category)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    article.title,
-                    article.description,
-                    article.content,
-                    article.url,
-                    article.source,
-                    article.published_at.isoformat(),
-                    article.image_url,
-                    article.sentiment_score,
-                    article.sentiment_label,
-                    ','.join(article.keywords),
-                    category or 'general'
-                ))
-                saved_count += 1
-            except sqlite3.IntegrityError:
-                continue
-        
-        conn.commit()
-        conn.close()
+        for article, text, (score, label) in zip(articles, texts, sentiments):
+            article.sentiment_score, article.sentiment_label = score, label
+            article.keywords = self.extract_keywords(text)
+        
+        return articles
+    
+    def articles_to_dataframe(self, articles: List[NewsArticle], category: str = None) -> 'pd.DataFrame':
+        """Column-store view of processed articles for analytics"""
+        pd = _pandas()
+        return pd.DataFrame.from_records(
+            [(article.title, article.source, article.published_at, article.sentiment_score,
+              article.sentiment_label, category or 'general', ','.join(article.keywords))
+             for article in articles],
+            columns=['title', 'source', 'published_at', 'sentiment_score',
+                     'sentiment_label', 'category', 'keywords']
+        )
+    
+    def get_analytics_summary(self, days: int = 30) -> List[tuple]:
+        """Article count and average sentiment per source and sentiment label"""
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT source, sentiment_label, COUNT(*), AVG(sentiment_score)
+                FROM articles
+                WHERE created_at >= datetime('now', ?)
+                GROUP BY source, sentiment_label
+            """, (f'-{days} days',))
+            return cursor.fetchall()
+    
+    def get_top_keywords(self, days: int = 30, limit: int = 10) -> List[tuple]:
+        """Most frequent keywords as (keyword, count) pairs"""
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT k.keyword, COUNT(*)
+                FROM article_keywords k
+                JOIN articles a ON a.id = k.article_id
+                WHERE a.created_at >= datetime('now', ?)
+                GROUP BY k.keyword
+                ORDER BY 2 DESC
+                LIMIT ?
+            """, (f'-{days} days', limit))
+            return cursor.fetchall()
+    
+    def get_bookmarks(self, before: Optional[tuple] = None, limit: int = 20) -> List[tuple]:
+        """Fetch one page of bookmarks, newest first, without the content column"""
+        with self._lock:
+            if before is None:
+                cursor = self._conn.execute("""
+                    SELECT id, title, description, url, source, published_at,
+                           sentiment_score, sentiment_label, keywords
+                    FROM articles
+                    WHERE bookmarked = 1
+                    ORDER BY published_at DESC, id DESC
+                    LIMIT ?
+                """, (limit,))
+            else:
+                # before is the (published_at, id) key of the last row of the previous page
+                cursor = self._conn.execute("""
+                    SELECT id, title, description, url, source, published_at,
+                           sentiment_score, sentiment_label, keywords
+                    FROM articles
+                    WHERE bookmarked = 1 AND (published_at, id) < (?, ?)
+                    ORDER BY published_at DESC, id DESC
+                    LIMIT ?
+                """, (*before, limit))
+            return cursor.fetchall()
+    
+    def count_bookmarks(self) -> int:
+        """Number of bookmarked articles"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE bookmarked = 1"
+            ).fetchone()[0]
+    
+    def _insert_keywords(self, cursor, articles: List[NewsArticle]):
+        """Store article keywords in article_keywords; caller holds the lock"""
+        cursor.executemany("""
+            INSERT OR IGNORE INTO article_keywords (article_id, keyword)
+            SELECT id, ? FROM articles WHERE url = ?
+        """, [(keyword, article.url) for article in articles for keyword in article.keywords])
+    
+    def save_articles(self, articles: List[NewsArticle], category: str = None):
+        """Save articles to database in a single transaction"""
+        rows = [(
+            article.title,
+            article.description,
+            article.content,
+            article.url,
+            article.source,
+            article.published_at.isoformat(),
+            article.image_url,
+            article.sentiment_score,
+            article.sentiment_label,
+            ','.join(article.keywords),
+            category or 'general'
+        ) for article in articles]
+        
+        # Already-stored urls are skipped rather than replaced, which also
+        # keeps their bookmark flag intact
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            self._conn.execute("BEGIN IMMEDIATE")
+            cursor.executemany("""
+                INSERT OR IGNORE INTO articles 
+                (title, description, content, url, source, published_at, image_url,
+                 sentiment_score, sentiment_label, keywords, category)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            saved_count = cursor.rowcount
+            self._insert_keywords(cursor, articles)
         return saved_count
 
 class ModernNewsGUI:
@@ -251,7 +489,19 @@ class ModernNewsGUI:
         self.root = root
         self.analyzer = NewsAnalyzer()
         self.current_articles = []
+        self.articles_df = None
         self.is_loading = False
+        self._closed = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Card descriptors prepared by workers, built into widgets by the mainloop
+        self._card_q = queue.Queue()
+        self._card_generation = {}
+        self._card_producers = []
+        self._drain_job = None
+        
+        # Keyset cursor for the next bookmarks page
+        self._bookmarks_cursor = None
 
         # Initialize API key before GUI setup
         self.api_key = os.getenv('NEWS_API_KEY')
@@ -344,6 +594,18 @@ class ModernNewsGUI:
                        fieldbackground=self.colors['bg_secondary'],
                        foreground=self.colors['text_primary'],
                        background=self.colors['bg_secondary'])
+        
+        # Hover effect for every article card, bound once on the widget class
+        self.root.bind_class('ArticleCard', '<Enter>', self._on_card_enter)
+        self.root.bind_class('ArticleCard', '<Leave>', self._on_card_leave)
+    
+    def _on_card_enter(self, event):
+        """Highlight an article card on hover"""
+        event.widget.configure(bg=self.colors['bg_accent'])
+    
+    def _on_card_leave(self, event):
+        """Restore an article card's background"""
+        event.widget.configure(bg=self.colors['bg_secondary'])
     
     def setup_gui(self):
         """Setup the main GUI"""
@@ -525,6 +787,9 @@ class ModernNewsGUI:
         ttk.Button(bookmarks_control_frame, text="🗑️ Clear All",
                   command=self.clear_bookmarks, style='Custom.TButton').pack(side=tk.LEFT, padx=5)
         
+        self.load_more_bookmarks_btn = ttk.Button(bookmarks_control_frame, text="⬇ Load More",
+                                                  command=self.on_load_more_bookmarks, style='Custom.TButton')
+        
         self.bookmarks_count_label = ttk.Label(bookmarks_control_frame, text="0 bookmarks",
                                              style='Custom.TLabel')
         self.bookmarks_count_label.pack(side=tk.RIGHT, padx=10)
@@ -671,34 +936,17 @@ Dependencies Status:
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         canvas.bind("<MouseWheel>", on_mousewheel)
     
-    def create_article_card(self, article, parent, show_bookmark=True):
-        """Create a modern article card"""
-        # Main card frame with border effect
-        card_frame = tk.Frame(parent, bg=self.colors['bg_secondary'], relief='flat', bd=0)
-        card_frame.pack(fill=tk.X, padx=5, pady=8)
-        
-        # Add hover effect
-        def on_enter(e):
-            card_frame.configure(bg=self.colors['bg_accent'])
-        
-        def on_leave(e):
-            card_frame.configure(bg=self.colors['bg_secondary'])
-        
-        card_frame.bind("<Enter>", on_enter)
-        card_frame.bind("<Leave>", on_leave)
-        
-        # Inner padding frame
-        inner_frame = tk.Frame(card_frame, bg=self.colors['bg_secondary'])
-        inner_frame.pack(fill=tk.X, padx=15, pady=12)
-        
-        # Header with source and sentiment
-        header_frame = tk.Frame(inner_frame, bg=self.colors['bg_secondary'])
-        header_frame.pack(fill=tk.X, pady=(0, 8))
-        
+    def prepare_card(self, article, show_bookmark=True, now=None):
+        """Compute everything a card displays; safe to call off the main thread"""
         # Source and date
         source_text = f"📰 {article.source}"
         if hasattr(article, 'published_at') and article.published_at:
-            time_diff = datetime.now() - article.published_at.replace(tzinfo=None)
+            if now is None:
+                now = datetime.now(timezone.utc)
+            published_at = article.published_at
+            if published_at.tzinfo is None:
+                published_at = published_at.replace(tzinfo=timezone.utc)
+            time_diff = now - published_at
             if time_diff.days > 0:
                 time_str = f"{time_diff.days}d ago"
             elif time_diff.seconds > 3600:
@@ -707,11 +955,6 @@ Dependencies Status:
                 time_str = f"{time_diff.seconds // 60}m ago"
             source_text += f" • {time_str}"
         
-        source_label = tk.Label(header_frame, text=source_text, 
-                               bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                               font=('Helvetica', 9))
-        source_label.pack(side=tk.LEFT)
-        
         # Sentiment indicator
         sentiment_color = self.colors['neutral']
         sentiment_icon = "😐"
@@ -723,29 +966,72 @@ Dependencies Status:
                 sentiment_color = self.colors['negative']
                 sentiment_icon = "😞"
         
-        sentiment_label = tk.Label(header_frame, text=f"{sentiment_icon} {article.sentiment_label.capitalize()}" if hasattr(article, 'sentiment_label') else "",
-                                  bg=self.colors['bg_secondary'], fg=sentiment_color,
+        sentiment_text = f"{sentiment_icon} {article.sentiment_label.capitalize()}" if hasattr(article, 'sentiment_label') else ""
+        
+        # Description
+        desc_text = None
+        if article.description:
+            desc_text = article.description[:200] + "..." if len(article.description) > 200 else article.description
+        
+        # Keywords
+        keywords_text = None
+        if hasattr(article, 'keywords') and article.keywords:
+            keywords_text = "🏷️ " + " • ".join(article.keywords[:5])
+        
+        return {
+            'article': article,
+            'title': article.title,
+            'source_text': source_text,
+            'sentiment_text': sentiment_text,
+            'sentiment_color': sentiment_color,
+            'desc_text': desc_text,
+            'keywords_text': keywords_text,
+            'show_bookmark': show_bookmark
+        }
+    
+    def _build_card_widget(self, card, parent):
+        """Create a modern article card from a prepare_card descriptor"""
+        article = card['article']
+        
+        # Main card frame with border effect; hover comes from the ArticleCard class bindings
+        card_frame = tk.Frame(parent, class_='ArticleCard', bg=self.colors['bg_secondary'],
+                              relief='flat', bd=0)
+        card_frame.pack(fill=tk.X, padx=5, pady=8)
+        
+        # Inner padding frame
+        inner_frame = tk.Frame(card_frame, bg=self.colors['bg_secondary'])
+        inner_frame.pack(fill=tk.X, padx=15, pady=12)
+        
+        # Header with source and sentiment
+        header_frame = tk.Frame(inner_frame, bg=self.colors['bg_secondary'])
+        header_frame.pack(fill=tk.X, pady=(0, 8))
+        
+        source_label = tk.Label(header_frame, text=card['source_text'], 
+                               bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
+                               font=('Helvetica', 9))
+        source_label.pack(side=tk.LEFT)
+        
+        sentiment_label = tk.Label(header_frame, text=card['sentiment_text'],
+                                  bg=self.colors['bg_secondary'], fg=card['sentiment_color'],
                                   font=('Helvetica', 9, 'bold'))
         sentiment_label.pack(side=tk.RIGHT)
         
         # Title
-        title_label = tk.Label(inner_frame, text=article.title,
+        title_label = tk.Label(inner_frame, text=card['title'],
                               bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
                               font=('Helvetica', 11, 'bold'), wraplength=800, justify=tk.LEFT)
         title_label.pack(anchor=tk.W, pady=(0, 5))
         
         # Description
-        if article.description:
-            desc_text = article.description[:200] + "..." if len(article.description) > 200 else article.description
-            desc_label = tk.Label(inner_frame, text=desc_text,
+        if card['desc_text']:
+            desc_label = tk.Label(inner_frame, text=card['desc_text'],
                                  bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
                                  font=('Helvetica', 9), wraplength=800, justify=tk.LEFT)
             desc_label.pack(anchor=tk.W, pady=(0, 8))
         
         # Keywords
-        if hasattr(article, 'keywords') and article.keywords:
-            keywords_text = "🏷️ " + " • ".join(article.keywords[:5])
-            keywords_label = tk.Label(inner_frame, text=keywords_text,
+        if card['keywords_text']:
+            keywords_label = tk.Label(inner_frame, text=card['keywords_text'],
                                      bg=self.colors['bg_secondary'], fg=self.colors['accent'],
                                      font=('Helvetica', 8))
             keywords_label.pack(anchor=tk.W, pady=(0, 8))
@@ -763,7 +1049,7 @@ Dependencies Status:
         read_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Bookmark button
-        if show_bookmark:
+        if card['show_bookmark']:
             bookmark_btn = tk.Button(actions_frame, text="🔖 Bookmark",
                                    command=lambda: self.toggle_bookmark(article),
                                    bg=self.colors['bg_accent'], fg=self.colors['text_secondary'],
@@ -773,6 +1059,57 @@ Dependencies Status:
         
         return card_frame
     
+    def render_article_cards(self, articles, parent, canvas, show_bookmark=True, append=False):
+        """Prepare cards on a worker thread and queue them for the mainloop to build"""
+        # Unless appending, any cards still queued for this frame belong to an older render
+        generation = self._card_generation.setdefault(parent, 0)
+        if not append:
+            generation += 1
+            self._card_generation[parent] = generation
+        
+        def produce():
+            # One clock snapshot for the whole render
+            now = datetime.now(timezone.utc)
+            for article in articles:
+                self._card_q.put((parent, canvas, generation,
+                                  self.prepare_card(article, show_bookmark, now)))
+        
+        if articles:
+            self._card_producers.append(self.executor.submit(produce))
+            if self._drain_job is None:
+                self._drain_job = self.root.after(16, self._drain_cards)
+        else:
+            # Nothing will be drawn; shrink the scroll region to the cleared frame
+            parent.update_idletasks()
+            canvas.configure(scrollregion=canvas.bbox("all"))
+    
+    def _drain_cards(self, per_tick=3):
+        """Build a few queued cards per frame so the UI stays responsive"""
+        self._drain_job = None
+        built = 0
+        dirty = set()
+        try:
+            while built < per_tick:
+                try:
+                    parent, canvas, generation, card = self._card_q.get_nowait()
+                except queue.Empty:
+                    break
+                if generation != self._card_generation.get(parent):
+                    continue
+                self._build_card_widget(card, parent)
+                dirty.add((parent, canvas))
+                built += 1
+            
+            # Update canvas scroll region
+            for parent, canvas in dirty:
+                parent.update_idletasks()
+                canvas.configure(scrollregion=canvas.bbox("all"))
+        finally:
+            # Keep ticking while cards are queued or producers may still add some
+            self._card_producers = [future for future in self._card_producers if not future.done()]
+            if self._card_producers or not self._card_q.empty():
+                self._drain_job = self.root.after(16, self._drain_cards)
+    
     def show_loading(self, message="Loading..."):
         """Show loading indicator"""
         self.is_loading = True
@@ -811,27 +1148,40 @@ Dependencies Status:
                 self.show_loading("Processing articles...")
                 
                 # Process articles
-                processed_articles = []
-                for article in articles:
-                    processed_article = self.analyzer.process_article(article)
-                    processed_articles.append(processed_article)
-                
-                # Save to database
-                saved_count = self.analyzer.save_articles(processed_articles, category)
-                
-                # Update UI in main thread
-                self.root.after(0, self.display_articles, processed_articles)
-                self.root.after(0, self.hide_loading, f"Loaded {len(processed_articles)} articles")
+                processed_articles = self.analyzer.process_articles_batch(articles)
+                self.articles_df = self.analyzer.articles_to_dataframe(processed_articles, category)
                 
             except Exception as e:
+                # The window was closed mid-fetch; there is no UI left to report to
+                if self._closed.is_set():
+                    return
                 self.root.after(0, self.hide_loading, "Error")
                 self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to fetch news: {str(e)}"))
+                return
+            
+            if self._closed.is_set():
+                return
+            
+            # Update UI in main thread
+            self.root.after(0, self.display_articles, processed_articles)
+            self.root.after(0, self.hide_loading, f"Loaded {len(processed_articles)} articles")
+            
+            # Save to database while the feed is drawn; a failed save does not undo the load
+            try:
+                self.analyzer.save_articles(processed_articles, category)
+            except Exception as e:
+                if self._closed.is_set():
+                    return
+                self.root.after(0, messagebox.showerror, "Error", f"Failed to save articles: {str(e)}")
         
         # Run in separate thread
         threading.Thread(target=fetch_and_display, daemon=True).start()
     
     def search_news(self):
         """Search news with query"""
+        if self.is_loading:
+            return
+        
         query = self.search_var.get().strip()
         if not query:
             messagebox.showwarning("Warning", "Please enter a search query")
@@ -853,19 +1203,22 @@ Dependencies Status:
                 self.show_loading("Processing search results...")
                 
                 # Process articles
-                processed_articles = []
-                for article in articles:
-                    processed_article = self.analyzer.process_article(article)
-                    processed_articles.append(processed_article)
+                processed_articles = self.analyzer.process_articles_batch(articles)
                 
                 # Save search query
                 self.save_search_query(query)
                 
+                if self._closed.is_set():
+                    return
+                
                 # Update UI in main thread
                 self.root.after(0, self.display_search_results, processed_articles, query)
                 self.root.after(0, self.hide_loading, f"Found {len(processed_articles)} articles")
                 
             except Exception as e:
+                # The window was closed mid-search; there is no UI left to report to
+                if self._closed.is_set():
+                    return
                 self.root.after(0, self.hide_loading, "Error")
                 self.root.after(0, lambda: messagebox.showerror("Error", f"Search failed: {str(e)}"))
         
@@ -886,16 +1239,11 @@ Dependencies Status:
                                         bg=self.colors['bg_primary'], fg=self.colors['text_secondary'],
                                         font=('Helvetica', 12))
             no_articles_label.pack(expand=True, pady=50)
-        else:
-            for article in articles:
-                self.create_article_card(article, self.news_feed_frame)
+        
+        self.render_article_cards(articles, self.news_feed_frame, self.news_canvas)
         
         # Update articles count
         self.articles_count_label.configure(text=f"{len(articles)} articles loaded")
-        
-        # Update canvas scroll region
-        self.news_feed_frame.update_idletasks()
-        self.news_canvas.configure(scrollregion=self.news_canvas.bbox("all"))
     
     def display_search_results(self, articles, query):
         """Display search results"""
@@ -912,13 +1260,8 @@ Dependencies Status:
                                        bg=self.colors['bg_primary'], fg=self.colors['text_secondary'],
                                        font=('Helvetica', 12))
             no_results_label.pack(expand=True, pady=50)
-        else:
-            for article in articles:
-                self.create_article_card(article, self.search_results_frame)
         
-        # Update canvas scroll region
-        self.search_results_frame.update_idletasks()
-        self.search_canvas.configure(scrollregion=self.search_canvas.bbox("all"))
+        self.render_article_cards(articles, self.search_results_frame, self.search_canvas)
         
         # Load recent searches
         self.load_recent_searches()
@@ -926,11 +1269,9 @@ Dependencies Status:
     def save_search_query(self, query):
         """Save search query to database"""
         try:
-            conn = sqlite3.connect(self.analyzer.db_path)
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO searches (query) VALUES (?)", (query,))
-            conn.commit()
-            conn.close()
+            with self.analyzer._lock, self.analyzer._conn:
+                cursor = self.analyzer._conn.cursor()
+                cursor.execute("INSERT INTO searches (query) VALUES (?)", (query,))
         except:
             pass
     
@@ -941,11 +1282,10 @@ Dependencies Status:
             widget.destroy()
         
         try:
-            conn = sqlite3.connect(self.analyzer.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT query FROM searches ORDER BY timestamp DESC LIMIT 5")
-            searches = cursor.fetchall()
-            conn.close()
+            with self.analyzer._lock:
+                cursor = self.analyzer._conn.cursor()
+                cursor.execute("SELECT DISTINCT query FROM searches ORDER BY timestamp DESC LIMIT 5")
+                searches = cursor.fetchall()
             
             for i, (query,) in enumerate(searches):
                 btn = tk.Button(self.recent_searches_frame, text=query,
@@ -964,43 +1304,45 @@ Dependencies Status:
     def toggle_bookmark(self, article):
         """Toggle bookmark for article"""
         try:
-            conn = sqlite3.connect(self.analyzer.db_path)
-            cursor = conn.cursor()
-            
-            # Check if already bookmarked
-            cursor.execute("SELECT bookmarked FROM articles WHERE url = ?", (article.url,))
-            result = cursor.fetchone()
-            
-            if result:
-                new_bookmark_state = 1 - result[0]  # Toggle between 0 and 1
-                cursor.execute("UPDATE articles SET bookmarked = ? WHERE url = ?", 
-                             (new_bookmark_state, article.url))
-                action = "added to" if new_bookmark_state else "removed from"
-                messagebox.showinfo("Bookmark", f"Article {action} bookmarks!")
-            else:
-                # Article not in database, add it
-                processed_article = self.analyzer.process_article(article)
-                cursor.execute("""
-                    INSERT INTO articles 
-                    (title, description, content, url, source, published_at, image_url,
-                     sentiment_score, sentiment_label, keywords, bookmarked)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-                """, (
-                    processed_article.title,
-                    processed_article.description,
-                    processed_article.content or '',
-                    processed_article.url,
-                    processed_article.source,
-                    processed_article.published_at.isoformat(),
-                    processed_article.image_url,
-                    processed_article.sentiment_score,
-                    processed_article.sentiment_label,
-                    ','.join(processed_article.keywords)
-                ))
-                messagebox.showinfo("Bookmark", "Article added to bookmarks!")
+            with self.analyzer._lock, self.analyzer._conn:
+                cursor = self.analyzer._conn.cursor()
+                # One transaction so the article and its keywords are saved together
+                self.analyzer._conn.execute("BEGIN IMMEDIATE")
+                
+                # Check if already bookmarked
+                cursor.execute("SELECT bookmarked FROM articles WHERE url = ?", (article.url,))
+                result = cursor.fetchone()
+                
+                if result:
+                    new_bookmark_state = 1 - result[0]  # Toggle between 0 and 1
+                    cursor.execute("UPDATE articles SET bookmarked = ? WHERE url = ?", 
+                                 (new_bookmark_state, article.url))
+                    action = "added to" if new_bookmark_state else "removed from"
+                    message = f"Article {action} bookmarks!"
+                else:
+                    # Article not in database, add it
+                    processed_article = self.analyzer.process_article(article)
+                    cursor.execute("""
+                        INSERT INTO articles 
+                        (title, description, content, url, source, published_at, image_url,
+                         sentiment_score, sentiment_label, keywords, bookmarked)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                    """, (
+                        processed_article.title,
+                        processed_article.description,
+                        processed_article.content or '',
+                        processed_article.url,
+                        processed_article.source,
+                        processed_article.published_at.isoformat(),
+                        processed_article.image_url,
+                        processed_article.sentiment_score,
+                        processed_article.sentiment_label,
+                        ','.join(processed_article.keywords)
+                    ))
+                    self.analyzer._insert_keywords(cursor, [processed_article])
+                    message = "Article added to bookmarks!"
             
-            conn.commit()
-            conn.close()
+            messagebox.showinfo("Bookmark", message)
             
             # Refresh bookmarks if on bookmarks tab
             if self.notebook.index(self.notebook.select()) == 3:  # Bookmarks tab
@@ -1010,64 +1352,72 @@ Dependencies Status:
             messagebox.showerror("Error", f"Failed to bookmark article: {str(e)}")
     
     def load_bookmarks(self):
-        """Load bookmarked articles"""
+        """Load the first page of bookmarked articles"""
         # Clear existing bookmarks
         for widget in self.bookmarks_frame.winfo_children():
             widget.destroy()
         
+        self._bookmarks_cursor = None
+        
         try:
-            conn = sqlite3.connect(self.analyzer.db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT title, description, url, source, published_at, 
-                       sentiment_score, sentiment_label, keywords
-                FROM articles 
-                WHERE bookmarked = 1
-                ORDER BY created_at DESC
-            """)
-            bookmarks = cursor.fetchall()
-            conn.close()
+            self.bookmarks_count_label.configure(text=f"{self.analyzer.count_bookmarks()} bookmarks")
             
-            self.bookmarks_count_label.configure(text=f"{len(bookmarks)} bookmarks")
-            
-            if not bookmarks:
+            if not self.load_more_bookmarks(append=False):
                 no_bookmarks_label = tk.Label(self.bookmarks_frame,
                                             text="No bookmarked articles yet. Bookmark articles from the news feed!",
                                             bg=self.colors['bg_primary'], fg=self.colors['text_secondary'],
                                             font=('Helvetica', 12))
                 no_bookmarks_label.pack(expand=True, pady=50)
-            else:
-                for bookmark_data in bookmarks:
-                    # Create article object from database data
-                    article = NewsArticle(
-                        title=bookmark_data[0],
-                        description=bookmark_data[1] or '',
-                        url=bookmark_data[2],
-                        source=bookmark_data[3],
-                        published_at=datetime.fromisoformat(bookmark_data[4])
-                    )
-                    article.sentiment_score = bookmark_data[5]
-                    article.sentiment_label = bookmark_data[6]
-                    article.keywords = bookmark_data[7].split(',') if bookmark_data[7] else []
-                    
-                    self.create_article_card(article, self.bookmarks_frame, show_bookmark=False)
-            
-            # Update canvas scroll region
-            self.bookmarks_frame.update_idletasks()
-            self.bookmarks_canvas.configure(scrollregion=self.bookmarks_canvas.bbox("all"))
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load bookmarks: {str(e)}")
     
+    def on_load_more_bookmarks(self):
+        """Handle the Load More button"""
+        try:
+            self.load_more_bookmarks()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load bookmarks: {str(e)}")
+    
+    def load_more_bookmarks(self, append=True, page_size=20):
+        """Append the next page of bookmarks; returns the number loaded"""
+        bookmarks = self.analyzer.get_bookmarks(before=self._bookmarks_cursor, limit=page_size)
+        
+        articles = []
+        for bookmark_data in bookmarks:
+            # Create article object from database data
+            article = NewsArticle(
+                title=bookmark_data[1],
+                description=bookmark_data[2] or '',
+                url=bookmark_data[3],
+                source=bookmark_data[4],
+                published_at=datetime.fromisoformat(bookmark_data[5])
+            )
+            article.sentiment_score = bookmark_data[6]
+            article.sentiment_label = bookmark_data[7]
+            article.keywords = bookmark_data[8].split(',') if bookmark_data[8] else []
+            articles.append(article)
+        
+        if bookmarks:
+            self._bookmarks_cursor = (bookmarks[-1][5], bookmarks[-1][0])
+        
+        # A short page means there is nothing left to load
+        if len(bookmarks) == page_size:
+            self.load_more_bookmarks_btn.pack(side=tk.LEFT, padx=5)
+        else:
+            self.load_more_bookmarks_btn.pack_forget()
+        
+        self.render_article_cards(articles, self.bookmarks_frame, self.bookmarks_canvas,
+                                  show_bookmark=False, append=append)
+        return len(bookmarks)
+    
     def clear_bookmarks(self):
         """Clear all bookmarks"""
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all bookmarks?"):
             try:
-                conn = sqlite3.connect(self.analyzer.db_path)
-                cursor = conn.cursor()
-                cursor.execute("UPDATE articles SET bookmarked = 0 WHERE bookmarked = 1")
-                conn.commit()
-                conn.close()
+                with self.analyzer._lock, self.analyzer._conn:
+                    cursor = self.analyzer._conn.cursor()
+                    cursor.execute("UPDATE articles SET bookmarked = 0 WHERE bookmarked = 1")
                 
                 self.load_bookmarks()
                 messagebox.showinfo("Success", "All bookmarks cleared!")
@@ -1082,15 +1432,9 @@ Dependencies Status:
             widget.destroy()
         
         try:
-            conn = sqlite3.connect(self.analyzer.db_path)
-            df = pd.read_sql_query("""
-                SELECT sentiment_label, sentiment_score, source, created_at, keywords
-                FROM articles 
-                WHERE created_at >= datetime('now', '-30 days')
-            """, conn)
-            conn.close()
+            summary = self.analyzer.get_analytics_summary(days=30)
             
-            if df.empty:
+            if not summary:
                 no_data_label = tk.Label(self.analytics_display,
                                        text="No data available for analytics. Fetch some news first!",
                                        bg=self.colors['bg_primary'], fg=self.colors['text_secondary'],
@@ -1109,9 +1453,17 @@ Dependencies Status:
             stats_frame = ttk.Frame(summary_frame, style='Secondary.TFrame')
             stats_frame.pack(fill=tk.X, padx=20, pady=10)
             
-            total_articles = len(df)
-            avg_sentiment = df['sentiment_score'].mean()
-            sentiment_dist = df['sentiment_label'].value_counts()
+            sentiment_dist = Counter()
+            source_counts = Counter()
+            score_total = 0.0
+            for source, label, count, avg_score in summary:
+                sentiment_dist[label] += count
+                if source:
+                    source_counts[source] += count
+                score_total += (avg_score or 0.0) * count
+            
+            total_articles = sum(sentiment_dist.values())
+            avg_sentiment = score_total / total_articles
             
             stats_text = f"""
 Total Articles Analyzed: {total_articles}
@@ -1127,16 +1479,16 @@ Neutral Articles: {sentiment_dist.get('neutral', 0)} ({sentiment_dist.get('neutr
             stats_label.pack(anchor=tk.W)
             
             # Top sources
-            if 'source' in df.columns:
+            if source_counts:
                 sources_frame = ttk.Frame(summary_frame, style='Secondary.TFrame')
                 sources_frame.pack(fill=tk.X, padx=20, pady=10)
                 
                 ttk.Label(sources_frame, text="Top News Sources:",
                          style='Custom.TLabel', font=('Helvetica', 11, 'bold')).pack(anchor=tk.W, pady=(10, 5))
                 
-                top_sources = df['source'].value_counts().head(5)
+                top_sources = source_counts.most_common(5)
                 sources_text = "\n".join([f"• {source}: {count} articles" 
-                                        for source, count in top_sources.items()])
+                                        for source, count in top_sources])
                 
                 sources_label = tk.Label(sources_frame, text=sources_text,
                                        bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
@@ -1144,27 +1496,42 @@ Neutral Articles: {sentiment_dist.get('neutral', 0)} ({sentiment_dist.get('neutr
                 sources_label.pack(anchor=tk.W)
             
             # Top keywords
-            if 'keywords' in df.columns:
-                all_keywords = []
-                for keywords_str in df['keywords'].dropna():
-                    if keywords_str:
-                        all_keywords.extend(keywords_str.split(','))
+            top_keywords = self.analyzer.get_top_keywords(days=30, limit=10)
+            if top_keywords:
+                keywords_frame = ttk.Frame(summary_frame, style='Secondary.TFrame')
+                keywords_frame.pack(fill=tk.X, padx=20, pady=10)
+                
+                ttk.Label(keywords_frame, text="Top Keywords:",
+                         style='Custom.TLabel', font=('Helvetica', 11, 'bold')).pack(anchor=tk.W, pady=(10, 5))
+                
+                keywords_text = " • ".join([f"{keyword} ({count})" 
+                                          for keyword, count in top_keywords])
+                
+                keywords_label = tk.Label(keywords_frame, text=keywords_text,
+                                        bg=self.colors['bg_secondary'], fg=self.colors['accent'],
+                                        font=('Helvetica', 9), wraplength=800, justify=tk.LEFT)
+                keywords_label.pack(anchor=tk.W)
+            
+            # Sentiment by source for the articles currently in the feed
+            if self.articles_df is not None and not self.articles_df.empty:
+                feed_frame = ttk.Frame(summary_frame, style='Secondary.TFrame')
+                feed_frame.pack(fill=tk.X, padx=20, pady=10)
                 
-                if all_keywords:
-                    keywords_frame = ttk.Frame(summary_frame, style='Secondary.TFrame')
-                    keywords_frame.pack(fill=tk.X, padx=20, pady=10)
-                    
-                    ttk.Label(keywords_frame, text="Top Keywords:",
-                             style='Custom.TLabel', font=('Helvetica', 11, 'bold')).pack(anchor=tk.W, pady=(10, 5))
-                    
-                    top_keywords = Counter(all_keywords).most_common(10)
-                    keywords_text = " • ".join([f"{keyword} ({count})" 
-                                              for keyword, count in top_keywords])
-                    
-                    keywords_label = tk.Label(keywords_frame, text=keywords_text,
-                                            bg=self.colors['bg_secondary'], fg=self.colors['accent'],
-                                            font=('Helvetica', 9), wraplength=800, justify=tk.LEFT)
-                    keywords_label.pack(anchor=tk.W)
+                ttk.Label(feed_frame, text="Current Feed by Source:",
+                         style='Custom.TLabel', font=('Helvetica', 11, 'bold')).pack(anchor=tk.W, pady=(10, 5))
+                
+                by_source = (self.articles_df.groupby(['source', 'sentiment_label']).size()
+                             .unstack(fill_value=0)
+                             .reindex(columns=['positive', 'neutral', 'negative'], fill_value=0))
+                by_source = by_source.loc[by_source.sum(axis=1).sort_values(ascending=False).index].head(5)
+                feed_text = "\n".join([f"• {source}: {row['positive']} positive, "
+                                       f"{row['neutral']} neutral, {row['negative']} negative"
+                                       for source, row in by_source.iterrows()])
+                
+                feed_label = tk.Label(feed_frame, text=feed_text,
+                                     bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
+                                     font=('Helvetica', 9), justify=tk.LEFT)
+                feed_label.pack(anchor=tk.W)
             
         except Exception as e:
             error_label = tk.Label(self.analytics_display,
@@ -1183,14 +1550,14 @@ Neutral Articles: {sentiment_dist.get('neutral', 0)} ({sentiment_dist.get('neutr
             )
             
             if file_path:
-                conn = sqlite3.connect(self.analyzer.db_path)
-                df = pd.read_sql_query("""
-                    SELECT title, description, url, source, published_at, 
-                           sentiment_score, sentiment_label, keywords, category, bookmarked
-                    FROM articles 
-                    ORDER BY published_at DESC
-                """, conn)
-                conn.close()
+                pd = _pandas()
+                with self.analyzer._lock:
+                    df = pd.read_sql_query("""
+                        SELECT title, description, url, source, published_at, 
+                               sentiment_score, sentiment_label, keywords, category, bookmarked
+                        FROM articles 
+                        ORDER BY published_at DESC
+                    """, self.analyzer._conn)
                 
                 df.to_csv(file_path, index=False)
                 messagebox.showinfo("Success", f"Data exported successfully to {file_path}")
@@ -1280,6 +1647,12 @@ Neutral Articles: {sentiment_dist.get('neutral', 0)} ({sentiment_dist.get('neutr
     def open_newsapi_website(self):
         """Open NewsAPI website"""
         webbrowser.open("https://newsapi.org/register")
+    
+    def close(self):
+        """Stop background work and release the analyzer's resources"""
+        self._closed.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.analyzer.close()
 
 def main():
     """Main function to run the application"""
@@ -1291,9 +1664,8 @@ def main():
     except ImportError:
         missing_deps.append("requests")
     
-    try:
-        import pandas
-    except ImportError:
+    # Only look pandas up here; it is imported when analytics first need it
+    if importlib.util.find_spec("pandas") is None:
         missing_deps.append("pandas")
     
     if missing_deps:
@@ -1312,6 +1684,7 @@ def main():
         root.after(1000, app.refresh_news)  # Auto-load news after 1 second
     
     root.mainloop()
+    app.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file